@@ -6,6 +6,7 @@ import json
 import os
 import uuid
 import zipfile
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from io import StringIO
@@ -219,7 +220,14 @@ def get_submissions_data():
     if not data_dir.exists():
         return submissions
     
-    for file_path in data_dir.glob("*.json"):
+    # os.scandir lets is_file() use the file type reported by the directory listing;
+    # entry.stat() below still costs one stat call per file, as Path.stat did.
+    with os.scandir(data_dir) as it:
+        entries = [e for e in it
+                   if e.name.endswith(".json") and e.is_file()]
+
+    for entry in entries:
+        file_path = Path(entry.path)
         try:
             with file_path.open("r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -231,7 +239,7 @@ def get_submissions_data():
                 "submitted_at": data.get("submitted_at", ""),
                 "completion_seconds": data.get("completion_seconds"),
                 "payload": data.get("payload", {}),
-                "file_size": file_path.stat().st_size,
+                "file_size": entry.stat().st_size,
                 "file_path": str(file_path)
             }
             
@@ -251,6 +259,60 @@ def get_submissions_data():
     submissions.sort(key=lambda x: x.get("submitted_at") or "", reverse=True)
     return submissions
 
+@lru_cache(maxsize=4096)
+def _parse_iso_dt(s: str):
+    """Parse an ISO timestamp (``Z`` suffix allowed); None if unparseable.
+    Cached because the admin filters re-parse every submitted_at on each request.
+    """
+    try:
+        return datetime.fromisoformat((s or "").replace("Z", "+00:00"))
+    except Exception:
+        return None
+
+
+def _filter_submissions(submissions, search, date_from, date_to, test_type):
+    """Apply the admin dashboard/export filters to a list of submission summaries."""
+    def _submitted_dt(submission):
+        # Hand-edited files may hold a non-string submitted_at; it is unhashable for the cache
+        value = submission["submitted_at"]
+        return _parse_iso_dt(value) if isinstance(value, str) else None
+
+    if search:
+        needle = search.lower()
+        submissions = [s for s in submissions if 
+                      needle in s["patient_name"].lower() or 
+                      needle in s["provider_name"].lower() or
+                      needle in s["filename"].lower()]
+    
+    # Robust date filtering using parsed datetimes
+    if date_from:
+        if "T" in date_from:
+            dt_from = _parse_iso_dt(date_from)
+        else:
+            eastern = ZoneInfo("America/New_York") if ZoneInfo else timezone(timedelta(hours=-5))
+            try:
+                dt_from = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=eastern)
+            except Exception:
+                dt_from = None
+        if dt_from:
+            submissions = [s for s in submissions if (_submitted_dt(s) or datetime.min.replace(tzinfo=timezone.utc)) >= dt_from]
+    
+    if date_to:
+        if "T" in date_to:
+            dt_to = _parse_iso_dt(date_to)
+        else:
+            eastern = ZoneInfo("America/New_York") if ZoneInfo else timezone(timedelta(hours=-5))
+            try:
+                dt_to = datetime.strptime(date_to, "%Y-%m-%d").replace(tzinfo=eastern) + timedelta(hours=23, minutes=59, seconds=59)
+            except Exception:
+                dt_to = None
+        if dt_to:
+            submissions = [s for s in submissions if (_submitted_dt(s) or datetime.min.replace(tzinfo=timezone.utc)) <= dt_to]
+    
+    if test_type:
+        submissions = [s for s in submissions if s["test_type"] == test_type]
+    return submissions
+
 @app.get("/admin")
 def admin_login():
     """Admin login page."""
@@ -281,50 +343,10 @@ def admin_dashboard():
     date_to = request.args.get("date_to", "")
     test_type = request.args.get("test_type", "")
     
-    submissions = get_submissions_data()
-    
-    # Apply filters
-    if search:
-        submissions = [s for s in submissions if 
-                      search.lower() in s["patient_name"].lower() or 
-                      search.lower() in s["provider_name"].lower() or
-                      search.lower() in s["filename"].lower()]
-    
-    # Robust date filtering using parsed datetimes
-    def _parse_dt(s: str):
-        try:
-            return datetime.fromisoformat((s or "").replace("Z", "+00:00"))
-        except Exception:
-            return None
-    if date_from:
-        if "T" in date_from:
-            dt_from = _parse_dt(date_from)
-        else:
-            eastern = ZoneInfo("America/New_York") if ZoneInfo else timezone(timedelta(hours=-5))
-            try:
-                dt_from = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=eastern)
-            except Exception:
-                dt_from = None
-        if dt_from:
-            submissions = [s for s in submissions if (_parse_dt(s["submitted_at"]) or datetime.min.replace(tzinfo=timezone.utc)) >= dt_from]
-    
-    if date_to:
-        if "T" in date_to:
-            dt_to = _parse_dt(date_to)
-        else:
-            eastern = ZoneInfo("America/New_York") if ZoneInfo else timezone(timedelta(hours=-5))
-            try:
-                dt_to = datetime.strptime(date_to, "%Y-%m-%d").replace(tzinfo=eastern) + timedelta(hours=23, minutes=59, seconds=59)
-            except Exception:
-                dt_to = None
-        if dt_to:
-            submissions = [s for s in submissions if (_parse_dt(s["submitted_at"]) or datetime.min.replace(tzinfo=timezone.utc)) <= dt_to]
-    
-    if test_type:
-        submissions = [s for s in submissions if s["test_type"] == test_type]
+    all_submissions = get_submissions_data()
+    submissions = _filter_submissions(all_submissions, search, date_from, date_to, test_type)
     
     # Get unique test types for filter dropdown
-    all_submissions = get_submissions_data()
     test_types = sorted(set(s["test_type"] for s in all_submissions if s["test_type"]))
     
     return render_template("admin.html", 
@@ -396,46 +418,7 @@ def admin_export_csv():
     date_to = request.args.get("date_to", "")
     test_type = request.args.get("test_type", "")
     
-    submissions = get_submissions_data()
-    
-    # Apply same filters as dashboard
-    if search:
-        submissions = [s for s in submissions if 
-                      search.lower() in s["patient_name"].lower() or 
-                      search.lower() in s["provider_name"].lower() or
-                      search.lower() in s["filename"].lower()]
-    
-    def _parse_dt(s: str):
-        try:
-            return datetime.fromisoformat((s or "").replace("Z", "+00:00"))
-        except Exception:
-            return None
-    if date_from:
-        if "T" in date_from:
-            dt_from = _parse_dt(date_from)
-        else:
-            eastern = ZoneInfo("America/New_York") if ZoneInfo else timezone(timedelta(hours=-5))
-            try:
-                dt_from = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=eastern)
-            except Exception:
-                dt_from = None
-        if dt_from:
-            submissions = [s for s in submissions if (_parse_dt(s["submitted_at"]) or datetime.min.replace(tzinfo=timezone.utc)) >= dt_from]
-    
-    if date_to:
-        if "T" in date_to:
-            dt_to = _parse_dt(date_to)
-        else:
-            eastern = ZoneInfo("America/New_York") if ZoneInfo else timezone(timedelta(hours=-5))
-            try:
-                dt_to = datetime.strptime(date_to, "%Y-%m-%d").replace(tzinfo=eastern) + timedelta(hours=23, minutes=59, seconds=59)
-            except Exception:
-                dt_to = None
-        if dt_to:
-            submissions = [s for s in submissions if (_parse_dt(s["submitted_at"]) or datetime.min.replace(tzinfo=timezone.utc)) <= dt_to]
-    
-    if test_type:
-        submissions = [s for s in submissions if s["test_type"] == test_type]
+    submissions = _filter_submissions(get_submissions_data(), search, date_from, date_to, test_type)
     
     # Create CSV
     output = StringIO()
@@ -695,8 +678,9 @@ def save_draft():
         "current_step": current_step,
         "payload": payload,
     }
+    # Drafts are rewritten on every autosave and only read back by the app, so keep them compact
     with draft_path.open("w", encoding="utf-8") as f:
-        json.dump(record, f, ensure_ascii=False, indent=2)
+        json.dump(record, f, ensure_ascii=False, separators=(",", ":"))
     return jsonify({"ok": True, "form_id": form_id, "started_at": started_at})
 
 @app.get("/draft/load")
@@ -748,7 +732,7 @@ def start_new_form():
             "last_saved_at": started_at,
             "current_step": 0,
             "payload": {},
-        }, f, ensure_ascii=False, indent=2)
+        }, f, ensure_ascii=False, separators=(",", ":"))
     return jsonify({"ok": True, "form_id": form_id, "started_at": started_at})
 
 @app.post("/draft/delete")
@@ -767,6 +751,28 @@ def delete_draft():
     except OSError as e:
         return jsonify({"ok": False, "error": str(e)}), 500
 
+@lru_cache(maxsize=4)
+def _load_searchable_profiles(path: str, mtime_ns: int):
+    """Load profiles once per file version, paired with their lowercased search text.
+    mtime_ns is part of the cache key so a regenerated file is picked up on the next request.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        profiles = json.load(f)
+    if not isinstance(profiles, list):
+        return ()
+    return tuple(
+        (patient, " ".join([
+            _safe_str(patient.get("patient_first_name", "")),
+            _safe_str(patient.get("patient_last_name", "")),
+            _safe_str(patient.get("member_id", "")),
+            _safe_str(patient.get("patient_dob", "")),
+            _safe_str(patient.get("provider_name", ""))
+        ]).lower())
+        for patient in profiles
+        if isinstance(patient, dict)
+    )
+
+
 @app.get("/api/search-patients")
 def api_search_patients():
     """Search patients in JSONL files based on query parameters."""
@@ -784,23 +790,13 @@ def api_search_patients():
         unstructured_file = project_root / "unstructured_profiles.json"
     if unstructured_file.exists():
         try:
-            with open(unstructured_file, 'r', encoding='utf-8') as f:
-                unstructured = json.load(f)
-                if isinstance(unstructured, list):
-                    for patient in unstructured:
-                        if not isinstance(patient, dict):
-                            continue
-                        searchable_text = " ".join([
-                            _safe_str(patient.get("patient_first_name", "")),
-                            _safe_str(patient.get("patient_last_name", "")),
-                            _safe_str(patient.get("member_id", "")),
-                            _safe_str(patient.get("patient_dob", "")),
-                            _safe_str(patient.get("provider_name", ""))
-                        ]).lower()
-                        if query in searchable_text:
-                            p = dict(patient)
-                            p["_source"] = "unstructured"
-                            results.append(p)
+            profiles = _load_searchable_profiles(str(unstructured_file), unstructured_file.stat().st_mtime_ns)
+            for patient, searchable_text in profiles:
+                if query in searchable_text:
+                    # Copy so the cached profile is never mutated
+                    p = dict(patient)
+                    p["_source"] = "unstructured"
+                    results.append(p)
         except (json.JSONDecodeError, OSError):
             pass
     
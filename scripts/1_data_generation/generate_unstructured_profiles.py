@@ -1,19 +1,107 @@
 import json
 import logging
+import os
+import random
 import sys
 import time
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
+import orjson
 from openai import OpenAI
 from dotenv import load_dotenv
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
-client = OpenAI()
 ROOT_DIR = Path(__file__).resolve().parents[2]
 
+# Groundtruth-only clinical flags; the clinical note replaces them in unstructured profiles
+_CLINICAL_FLAG_KEYS = frozenset({
+    'mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'autism',
+    'early_onset', 'previous_test_negative', 'family_history', 'consanguinity',
+})
+
+# Prompt text is identical for every request: built once here, and the shared
+# system/instruction prefix keeps requests eligible for server-side prompt caching.
+_PROMPT_FIELDS = (
+    'sample_type', 'patient_first_name', 'patient_last_name', 'patient_dob', 'sex',
+    'mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'autism', 'early_onset',
+    'family_history', 'consanguinity', 'icd_codes', 'secondary_icd_codes', 'prior_test_type',
+    'prior_test_result', 'prior_test_date',
+)
+
+_SYSTEM_PROMPT = """You are an experienced medical scribe tasked with generating a concise, clinically realistic narrative note 
+    for a patient encounter. The input dictionary at the end defines the patient’s clinical profile. Follow all rules below strictly."""
+
+_USER_INSTRUCTIONS = """ 1) Clinical description: Use the provided icd_codes strictly as the source defining what may be described in the clinical note. 
+    Each major clinical feature must be directly supported by one or more of the provided ICD codes, and descriptions must remain within the semantic 
+    scope of each code. If an ICD code represents a symptom or sign (e.g.,codes in the R-category), describe only observable features and do not 
+    upgrade these findings into a formal diagnosis unless supported by other ICD codes. If an ICD code represents a specific diagnosis or named 
+    condition (e.g., congenital malformations or defined metabolic disorders), describe with specificity encoded by the ICD code and do NOT 
+    generalize it into a broader category. Do NOT state the ICD codes explicitly in the note. 
+    2) If the metabolic flag is true, describe with clinically interpretable results, such as the named analyte, direction 
+    and magnitude of abnormality, and whether the finding is persistent or episodic (for example, chronically elevated phenylalanine 
+    levels with dietary sensitivity). You may also generate specific lab results as supporting evidence. Do not use vague or placeholder 
+    language such as “abnormal labs,” “blood chemistry findings,” or nonspecific “laboratory abnormalities.” 
+    3) If the dysmorphic flag is true, explain with 1~2 concrete descriptors rather than a broad statement.
+    4) Family history: If family_history is true, generate records for affected relatives and/or consanguinity with details. Provide details 
+    such as the relative's relationship and specific conditions. If consanguinity is true, explicitly describe the parents’ actual biological 
+    relationship (for example, “the parents are first cousins”) rather than using vague language such as “biologically related”.
+    5) Prior testing: If prior_test_type, prior_test_result, and prior_test_date are present, include a brief factual summary of the test, date, 
+    and result only.
+    6) Age calculation: Calculate the patient’s current age accurately using today’s date. If it is absent, do not mention age.
+    7) Language: Avoid lists, headings, or formulaic expressions when making clinical descriptions (e.g., “The patient presents with…”). Use natural 
+    clinical phrasing such as “History is notable for…,” “Since early childhood…,” or “Clinical concerns include…”. Use concrete descriptions and avoid 
+    non-informative or defensive phrasing such as “no documented evidence of…” and “otherwise unremarkable” unless uncertainty is clinically meaningful. 
+    Clearly describe symptom type, pattern, and functional impact (e.g., frequency, severity, triggers, effect on school or daily activities). Avoid 
+    generic terms like “issues”, “concerns” or “abnormalities” without qualification.
+    8) Format: Generate one paragraph of at least 160 words and no more than 200 words for the primary clinical description (including symtoms/phenotypes 
+    and family history/prior test). If the sample type is 3a where secondary_icd_codes list also provided, generate a separate paragraph indicated as secondary 
+    medical issues or histories of no more than 100 words. The note should read like a real specialist clinical document, suitable for chart review.
+    9) Realism: Do not make extra interpretation or imply any causations between co-existing conditions. Avoid vague or placeholder laboratory language. 
+    Do not include assessment plans, recommendations, or speculative commentary beyond what the data supports.
+
+    Input dictionary:
+    """
+
+# Shared by every request line; orjson serialises the same object each time
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Batch status polling: tight at first so small jobs return promptly, then backing off
+# for long-running jobs. OPENAI_BATCH_POLL_INTERVAL (seconds) pins a fixed interval.
+_BATCH_POLL_TIERS = ((120, 5.0), (600, 15.0))  # (elapsed seconds below, interval)
+_BATCH_POLL_MAX_INTERVAL = 60.0
+
+def _parse_poll_interval_override(raw: Optional[str]) -> Optional[float]:
+    """Validate OPENAI_BATCH_POLL_INTERVAL up front, so a bad value fails before any batch is submitted."""
+    if raw is None or not raw.strip():
+        return None
+    try:
+        interval = float(raw)
+    except ValueError:
+        raise ValueError(f"OPENAI_BATCH_POLL_INTERVAL must be a number of seconds, got {raw!r}") from None
+    if not 0 < interval < float("inf"):
+        raise ValueError(f"OPENAI_BATCH_POLL_INTERVAL must be a positive number of seconds, got {raw!r}")
+    return interval
+
+_BATCH_POLL_INTERVAL_OVERRIDE = _parse_poll_interval_override(os.getenv("OPENAI_BATCH_POLL_INTERVAL"))
+
+def _get_poll_interval(elapsed: float) -> float:
+    if _BATCH_POLL_INTERVAL_OVERRIDE is not None:
+        return _BATCH_POLL_INTERVAL_OVERRIDE
+    for limit, interval in _BATCH_POLL_TIERS:
+        if elapsed < limit:
+            return interval
+    return _BATCH_POLL_MAX_INTERVAL
+
+@lru_cache(maxsize=1)
+def get_client() -> OpenAI:
+    """Create the OpenAI client on first use, so importing this module (as exp_eval
+    and ablation_2 do for process_batch) needs no API key or client setup."""
+    return OpenAI()
+
 def profile_key(profile: Dict) -> str:
     patient_id = profile.get("patient_id")
     if patient_id:
@@ -31,8 +119,8 @@ def load_existing_profiles(output_path: str) -> List[Dict]:
     if not output_file.exists() or output_file.stat().st_size == 0:
         return []
 
-    with output_file.open('r', encoding='utf-8') as f:
-        existing_content = json.load(f)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handlers still apply
+    existing_content = orjson.loads(output_file.read_bytes())
     if not isinstance(existing_content, list):
         raise ValueError(f"Existing output must be a JSON list: {output_path}")
     return existing_content
@@ -43,63 +131,26 @@ def filter_missing_profiles(all_samples: List[Dict], existing_profiles: List[Dic
 
 def create_prompt_dict(profile: Dict) -> dict:
     # Create a copy of the input profile with only the required fields
-    key_fields = ['sample_type', 'patient_first_name', 'patient_last_name', 'patient_dob', 'sex', 
-                  'mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'autism', 'early_onset',
-                  'family_history', 'consanguinity', 'icd_codes','secondary_icd_codes', 'prior_test_type', 
-                  'prior_test_result', 'prior_test_date']
     input_dict = {}
-    for key in key_fields:
+    for key in _PROMPT_FIELDS:
         value = profile.get(key)
         if value is not None and value is not False:
             input_dict[key] = value
     return input_dict
 
 def create_user_prompt(input_dict: Dict) -> str:
-    prompt = """ 1) Clinical description: Use the provided icd_codes strictly as the source defining what may be described in the clinical note. 
-    Each major clinical feature must be directly supported by one or more of the provided ICD codes, and descriptions must remain within the semantic 
-    scope of each code. If an ICD code represents a symptom or sign (e.g.,codes in the R-category), describe only observable features and do not 
-    upgrade these findings into a formal diagnosis unless supported by other ICD codes. If an ICD code represents a specific diagnosis or named 
-    condition (e.g., congenital malformations or defined metabolic disorders), describe with specificity encoded by the ICD code and do NOT 
-    generalize it into a broader category. Do NOT state the ICD codes explicitly in the note. 
-    2) If the metabolic flag is true, describe with clinically interpretable results, such as the named analyte, direction 
-    and magnitude of abnormality, and whether the finding is persistent or episodic (for example, chronically elevated phenylalanine 
-    levels with dietary sensitivity). You may also generate specific lab results as supporting evidence. Do not use vague or placeholder 
-    language such as “abnormal labs,” “blood chemistry findings,” or nonspecific “laboratory abnormalities.” 
-    3) If the dysmorphic flag is true, explain with 1~2 concrete descriptors rather than a broad statement.
-    4) Family history: If family_history is true, generate records for affected relatives and/or consanguinity with details. Provide details 
-    such as the relative's relationship and specific conditions. If consanguinity is true, explicitly describe the parents’ actual biological 
-    relationship (for example, “the parents are first cousins”) rather than using vague language such as “biologically related”.
-    5) Prior testing: If prior_test_type, prior_test_result, and prior_test_date are present, include a brief factual summary of the test, date, 
-    and result only.
-    6) Age calculation: Calculate the patient’s current age accurately using today’s date. If it is absent, do not mention age.
-    7) Language: Avoid lists, headings, or formulaic expressions when making clinical descriptions (e.g., “The patient presents with…”). Use natural 
-    clinical phrasing such as “History is notable for…,” “Since early childhood…,” or “Clinical concerns include…”. Use concrete descriptions and avoid 
-    non-informative or defensive phrasing such as “no documented evidence of…” and “otherwise unremarkable” unless uncertainty is clinically meaningful. 
-    Clearly describe symptom type, pattern, and functional impact (e.g., frequency, severity, triggers, effect on school or daily activities). Avoid 
-    generic terms like “issues”, “concerns” or “abnormalities” without qualification.
-    8) Format: Generate one paragraph of at least 160 words and no more than 200 words for the primary clinical description (including symtoms/phenotypes 
-    and family history/prior test). If the sample type is 3a where secondary_icd_codes list also provided, generate a separate paragraph indicated as secondary 
-    medical issues or histories of no more than 100 words. The note should read like a real specialist clinical document, suitable for chart review.
-    9) Realism: Do not make extra interpretation or imply any causations between co-existing conditions. Avoid vague or placeholder laboratory language. 
-    Do not include assessment plans, recommendations, or speculative commentary beyond what the data supports.
-
-    Input dictionary:
-    """
-    profile_string = json.dumps(input_dict, separators=(',', ':'), ensure_ascii=False)
-    prompt += f"\n{profile_string}\n"
-    return prompt
+    # orjson's compact UTF-8 output matches json.dumps(separators=(',', ':'), ensure_ascii=False)
+    profile_string = orjson.dumps(input_dict).decode('utf-8')
+    return f"{_USER_INSTRUCTIONS}\n{profile_string}\n"
 
 def create_batch_input(structured_profiles: List[dict], output: str):
-    system_prompt = """You are an experienced medical scribe tasked with generating a concise, clinically realistic narrative note 
-    for a patient encounter. The input dictionary at the end defines the patient’s clinical profile. Follow all rules below strictly."""
-
-    with open(output, 'w', encoding='utf-8') as outfile:
+    with open(output, 'wb', buffering=1 << 20) as outfile:
         for i, profile in enumerate(structured_profiles):
             prompt_dict = create_prompt_dict(profile)
             body = {
                 "model": "gpt-5.2",
                 "input": [
-                    {"role": "system", "content": system_prompt},
+                    _SYSTEM_MESSAGE,
                     {"role": "user", "content": create_user_prompt(prompt_dict)}
                 ],
                 "max_output_tokens": 400,
@@ -112,12 +163,12 @@ def create_batch_input(structured_profiles: List[dict], output: str):
                 "url": "/v1/responses",
                 "body": body,
             }
-            json_line = json.dumps(request_object, ensure_ascii=False)
-            outfile.write(json_line + '\n')
+            outfile.write(orjson.dumps(request_object) + b'\n')
 
     logger.info(f"Batch input file created successfully: {output}")
 
 def process_batch(batch_input: str) -> Optional[List[str]]:
+    client = get_client()
     try:
         upload_batch = client.files.create(file=open(batch_input, "rb"), purpose="batch")
         logger.info(f"Upload ID: {upload_batch.id}")
@@ -129,13 +180,15 @@ def process_batch(batch_input: str) -> Optional[List[str]]:
         )
         logger.info(f"Batch ID: {batch_job.id}")
 
+        start = time.monotonic()
         while True:
             batch = client.batches.retrieve(batch_job.id)
             logger.info(f"Current batch status: {batch.status}")         
             if batch.status in ["completed", "failed", "cancelled", "expired"]:
                 logger.info(f"Batch job finished with status: {batch.status}")
                 break
-            time.sleep(30)  # Wait for 30 seconds before checking again
+            # Jitter keeps concurrent pollers (e.g. parallel ablation runs) from syncing up
+            time.sleep(_get_poll_interval(time.monotonic() - start) + random.uniform(0.0, 1.0))
 
         if batch.status == "completed":
             output_file_id = getattr(batch, "output_file_id", None)
@@ -205,17 +258,14 @@ def create_unstructured_profiles(
         key = profile_key(groundtruth_profile)
         if key in existing_keys:
             continue
-        unstructured_profile = {key: value for key, value in groundtruth_profile.items() 
-                                if key not in 
-                                ['mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'autism', 
-                                 'early_onset', 'previous_test_negative', 'family_history', 'consanguinity']}
+        unstructured_profile = {key: value for key, value in groundtruth_profile.items()
+                                if key not in _CLINICAL_FLAG_KEYS}
         unstructured_profile["clinical_note"] = note
         unstructured_profiles.append(unstructured_profile)
         existing_keys.add(key)
 
     combined_profiles = existing_profiles + unstructured_profiles
-    with output_file.open('w', encoding='utf-8') as f:
-        json.dump(combined_profiles, f, indent=2, ensure_ascii=False)
+    output_file.write_bytes(orjson.dumps(combined_profiles, option=orjson.OPT_INDENT_2))
     logger.info(
         f"Wrote {len(unstructured_profiles)} new profiles to {output_path} "
         f"(total: {len(combined_profiles)})"
@@ -229,8 +279,8 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     try:
-        with open(args.input, "r", encoding="utf-8") as f:
-            groundtruth_profiles = json.load(f)
+        with open(args.input, "rb") as f:
+            groundtruth_profiles = orjson.loads(f.read())
         if not isinstance(groundtruth_profiles, list):
             logger.error("Input JSON must be a list of patient profiles.")
             sys.exit(1)
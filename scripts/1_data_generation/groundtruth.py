@@ -24,17 +24,54 @@ label_type = 4 (NAME COLLISION):
     - Multiple patients intentionally share the same patient first/last name
 """
 import argparse
-import json
 import logging
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from copy import deepcopy
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional, Set
-# random.seed(120)
+
+import orjson
+# For reproducible output pass a seed to GroundtruthGenerator (or --seed); the global random state is not used.
+
+# Clinical flags default to False; assign_prior_test_and_rationale switches on the relevant ones.
+# Values are immutable, so a shallow ** spread per profile is enough (no deepcopy needed).
+_CLINICAL_FLAG_DEFAULTS = dict.fromkeys(
+    ('mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'autism',
+     'early_onset', 'prior_test_negative', 'family_history', 'consanguinity'),
+    False,
+)
+# Phenotype categories that ICD codes are drawn from, per rationale
+_PRIOR_NEGATIVE_PHENOTYPES = ("mca", "dd_id", "dysmorphic")   # rationale 1: prior testing negative
+_FAMILY_HISTORY_PHENOTYPES = ("metabolic", "neurological")    # rationale 2: family history
+# Flags cleared when a profile is turned into an irrelevant (3b) sample
+_3B_RESET_FLAGS = dict.fromkeys(
+    ('mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'family_history', 'previous_test_negative'),
+    False,
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(value: str) -> date:
+    """Parse a YYYY-MM-DD string; cached because error injection re-parses dates this module generated."""
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=None)
+def _load_validators() -> Optional[Tuple[Any, Any]]:
+    """Resolve (validate_submission, normalize_payload) from app.models once; None if unavailable."""
+    try:
+        from app.models import validate_submission, normalize_payload
+    except ImportError:
+        return None
+    return validate_submission, normalize_payload
+
 
 class GroundtruthGenerator: 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Per-generator RNG: seedable for reproducible datasets and independent of the global random state
+        self._rng = random.Random(seed)
         self.first_names = {
             'Male': [
                 'Aiden', 'Luca', 'Ezra', 'Milo', 'Nolan', 'Caleb', 'Owen', 'Leo', 'Roman',
@@ -194,68 +231,89 @@ class GroundtruthGenerator:
             "S06.0X0A": "concussion",
             "S01.01XA": "laceration"
         }
+        # Key sequences sampled for every profile; build them once instead of per call
+        self._all_first_names = tuple(self.first_names['Male'] + self.first_names['Female'])
+        self.irrelevant_icd_codes = tuple(self.irrelevant_icd_code_mapping)
+        self.lab_names = tuple(self.lab_test_code_map)
+        # Per lab: (test_type, code table) pairs, so one choice yields the table for that test
+        self.lab_test_bundles = {lab: tuple(tests.items()) for lab, tests in self.lab_test_code_map.items()}
+        self.icd_codes_by_phenotype = {phenotype: tuple(codes) for phenotype, codes in self.icd_code_mapping.items()}
+        # Reference date for all generated dates in this run
+        self.today = date.today()
+        # Parent/patient age gap used when none is given; drawn once per generator
+        self._default_subscriber_years_older = self._rng.randint(23, 35)
+        # CT area codes, pre-formatted as the "(203) " phone prefix
+        self._phone_area_prefixes = tuple(f"({area}) " for area in (203, 860, 475, 959))
+        self._ct_zip_codes = tuple(f"{zip_code:05d}" for zip_code in range(6000, 7000))
+        # Error injector per type-2 sub-label
+        self._sample_2_error_handlers = {
+            "2a": self._2a_assign_subscriber_dob_error,
+            "2b": self._2b_assign_wrong_collection_date,
+            "2c": self._2c_assign_empty_collection_date,
+        }
+
+    def _date_days_ago(self, days: int) -> str:
+        """Return the YYYY-MM-DD date `days` before today."""
+        return (self.today - timedelta(days=days)).isoformat()
     
     def generate_address(self) -> str:
         """Generate a realistic Connecticut address (state may later be corrupted)."""
-        number = random.randint(1, 9999)
-        street = random.choice(self.street_names)
-        city = random.choice(self.ct_cities)
-        zip_code = random.randint(6000, 6999)  # CT zip codes
-        return f"{number} {street}, {city}, CT {zip_code:05d}"
+        number = self._rng.randint(1, 9999)
+        street = self._rng.choice(self.street_names)
+        city = self._rng.choice(self.ct_cities)
+        zip_code = self._rng.choice(self._ct_zip_codes)  # CT zip codes
+        return f"{number} {street}, {city}, CT {zip_code}"
     
     def generate_phone(self) -> str:
         """Generate a realistic phone number."""
-        area = random.choice([203, 860, 475, 959])  # CT area codes
-        exchange = random.randint(200, 999)
-        number = random.randint(1000, 9999)
-        return f"({area}) {exchange}-{number}"
+        area_prefix = self._rng.choice(self._phone_area_prefixes)
+        exchange = self._rng.randint(200, 999)
+        number = self._rng.randint(1000, 9999)
+        return f"{area_prefix}{exchange}-{number}"
     
     def generate_member_id(self) -> str:
         """Generate a realistic Medicaid member ID."""
-        prefix = random.choice(['MCD', 'CT', 'HUS'])
-        number = random.randint(100000000, 999999999)
+        prefix = self._rng.choice(['MCD', 'CT', 'HUS'])
+        number = self._rng.randint(100000000, 999999999)
         return f"{prefix}{number}"
     
     def generate_npi(self) -> str:
         """Generate a valid-format NPI number."""
-        return str(random.randint(1000000000, 9999999999))
+        return str(self._rng.randint(1000000000, 9999999999))
     
+    def _patient_dob_days_ago(self) -> int:
+        years_ago = self._rng.randint(3, 15)      
+        days_ago = self._rng.randint(0, 365)
+        return years_ago * 365 + days_ago
+
     def generate_patient_dob(self) -> str:
         """Generate a realistic date of birth (3-15 years old)."""
-        years_ago = random.randint(3, 15)      
-        days_ago = random.randint(0, 365)
-        birth_date = datetime.now() - timedelta(days=years_ago * 365 + days_ago)
-        return birth_date.strftime('%Y-%m-%d')
+        return self._date_days_ago(self._patient_dob_days_ago())
         
-    def generate_subscriber_dob(self, patient_age, years_older = random.randint(23, 35)) -> str:
+    def generate_subscriber_dob(self, patient_age, years_older: Optional[int] = None) -> str:
+        if years_older is None:
+            years_older = self._default_subscriber_years_older
         years_ago = years_older + patient_age    
-        days_ago = random.randint(0, 365)
-        birth_date = datetime.now() - timedelta(days=years_ago * 365 + days_ago)
-        return birth_date.strftime('%Y-%m-%d')
+        days_ago = self._rng.randint(0, 365)
+        return self._date_days_ago(years_ago * 365 + days_ago)
     
     def generate_recent_date(self) -> str:
         """Generate a recent date (within last 30 days)."""
-        days_ago = random.randint(0, 30)
-        recent_date = datetime.now() - timedelta(days=days_ago)
-        return recent_date.strftime('%Y-%m-%d')
+        days_ago = self._rng.randint(0, 30)
+        return self._date_days_ago(days_ago)
     
     def pick_icd_code(self,phenotype:str):
         """Pick a random ICD code from the given phenotype category."""
-        codes = list(self.icd_code_mapping.get(phenotype, {}).keys())
+        codes = self.icd_codes_by_phenotype.get(phenotype, ())
         if phenotype == 'mca': 
-            k = min(len(codes), random.randint(2, 3))  # For MCA, pick more than one ICD code from the list
-            return random.sample(codes, k)
-        return random.choice(codes)
+            k = min(len(codes), self._rng.randint(2, 3))  # For MCA, pick more than one ICD code from the list
+            return self._rng.sample(codes, k)
+        return self._rng.choice(codes)
     
     def generate_icd_codes(self, rationale: int) -> list:
         """Generate ICD codes based on the rationale."""
         icd_codes = []
-        phenotypes = []
-        if rationale == 1: 
-            phenotypes = ["mca", "dd_id", "dysmorphic"] # prior testing negative
-        else:
-            phenotypes = ["metabolic", "neurological"] # family history
-        
+        phenotypes = _PRIOR_NEGATIVE_PHENOTYPES if rationale == 1 else _FAMILY_HISTORY_PHENOTYPES
         for phenotype in phenotypes:
             code = self.pick_icd_code(phenotype)
             if isinstance(code, list):
@@ -264,37 +322,40 @@ class GroundtruthGenerator:
                 icd_codes.append(code)
         return icd_codes
     
-    def assign_prior_test_and_rationale(self, rationale: int, profile: Dict):
-        """Populate prior test only if rationale = 1."""
+    def assign_prior_test_and_rationale(self, rationale: int, profile: Dict) -> None:
+        """Populate prior test only if rationale = 1 (mutates profile in place)."""
         if rationale == 1:
-            profile['prior_test_type'] = random.choice(self.prior_tests)  # Exclude empty option
-            profile['prior_test_result'] = "negative"
-            current_date = datetime.now()
-            prior_test_date = current_date - timedelta(days=random.randint(30, 180))
-            profile['prior_test_date'] = prior_test_date.strftime('%Y-%m-%d')  
-            profile['mca'] = True
-            profile['dd_id'] = True
-            profile['dysmorphic'] = True
-            profile['previous_test_negative'] = True
-        
+            prior_test_type = self._rng.choice(self.prior_tests)  # Exclude empty option
+            prior_test_date = self._date_days_ago(self._rng.randint(30, 180))
+            profile.update({
+                'prior_test_type': prior_test_type,
+                'prior_test_result': "negative",
+                'prior_test_date': prior_test_date,
+                'mca': True,
+                'dd_id': True,
+                'dysmorphic': True,
+                'previous_test_negative': True,
+            })
         else:
-            profile['metabolic'] = True
-            profile['neurological'] = True
-            profile['family_history'] = True
-            profile['consanguinity'] = random.choice([True, False])
+            profile.update({
+                'metabolic': True,
+                'neurological': True,
+                'family_history': True,
+                'consanguinity': self._rng.choice([True, False]),
+            })
 
     def generate_testing_info(self) -> Dict:
             """Assign test_type, test_configuration, urgency, specimen_type and consistent CPT codes using lab_test_code_map."""
             # Pick a random lab and test type that exists in the map
-            lab_name = random.choice(list(self.lab_test_code_map.keys()))
-            test_type = random.choice(list(self.lab_test_code_map[lab_name].keys()))
-            urgency = random.choice(self.urgency_levels)
-            test_config = random.choice(self.test_configurations)
+            lab_name = self._rng.choice(self.lab_names)
+            test_type, test_codes = self._rng.choice(self.lab_test_bundles[lab_name])
+            urgency = self._rng.choice(self.urgency_levels)
+            test_config = self._rng.choice(self.test_configurations)
             
             # Get internal test code and CPT codes from lab_test_code_map
-            internal_test_code = self.lab_test_code_map[lab_name][test_type][urgency][test_config]
-            cpt_codes = self.lab_test_code_map[lab_name][test_type]["CPT Codes"][test_config]
-            specimen_type = random.choice(self.specimen_types)
+            internal_test_code = test_codes[urgency][test_config]
+            cpt_codes = test_codes["CPT Codes"][test_config]
+            specimen_type = self._rng.choice(self.specimen_types)
             
             return {
                 'lab_name': lab_name,
@@ -311,16 +372,16 @@ class GroundtruthGenerator:
         """Check if a given year is a leap year."""
         return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
    
-    def _2a_assign_subscriber_dob_error(self, profile: Dict):
+    def _2a_assign_subscriber_dob_error(self, profile: Dict) -> None:
         """Assign subscriber DOB only 10-12 years older than patient DOB."""
         patient_dob_str = profile.get('patient_dob')
         if not patient_dob_str:
             logging.error("patient_dob is missing or None")
             profile['subscriber_dob'] = ''
             return
-        patient_age = (datetime.now() - datetime.strptime(patient_dob_str, '%Y-%m-%d')).days // 365
+        patient_age = (self.today - _parse_ymd(patient_dob_str)).days // 365
         try:
-            years_older = random.randint(10, 12)
+            years_older = self._rng.randint(10, 12)
             profile['subscriber_dob'] = self.generate_subscriber_dob(patient_age, years_older)
         except ValueError as e:
             logging.error(f"Error parsing patient or subscriber DOB: {e}")
@@ -333,9 +394,9 @@ class GroundtruthGenerator:
             logging.error("prior_test_date is missing or None")
             return
         try:
-            prior_test_dt = datetime.strptime(prior_test_date_str, '%Y-%m-%d')
-            earlier_collection_date = prior_test_dt - timedelta(days=random.randint(1, 10))
-            profile['collection_date'] = earlier_collection_date.strftime('%Y-%m-%d')
+            prior_test_date = _parse_ymd(prior_test_date_str)
+            earlier_collection_date = prior_test_date - timedelta(days=self._rng.randint(1, 10))
+            profile['collection_date'] = earlier_collection_date.isoformat()
         except ValueError as e:
             logging.error(f"Error parsing prior_test_date: {e}")
             profile['collection_date'] = ''  # Fallback to empty if parsing fails
@@ -344,34 +405,29 @@ class GroundtruthGenerator:
             """Assign empty collection date for WES/WGS."""
             profile['collection_date'] = ''
 
-    def introduce_sample_2_errors(self, profile: Dict, sub_label: str):
+    def introduce_sample_2_errors(self, profile: Dict, sub_label: str) -> None:
         """
         Introduce specific data errors into the profile for negative testing.
         Used ONLY for label_type = 2 subcategories (2a, 2b, 2c, 2d, 2e).
         """    
-        if sub_label == "2a":
-            self._2a_assign_subscriber_dob_error(profile)
-        elif sub_label == "2b":
-            self._2b_assign_wrong_collection_date(profile)
-        elif sub_label == "2c":
-            self._2c_assign_empty_collection_date(profile)
-
-    def reset_profile_for_3b(self, profile: Dict):        
-        for key in ('mca', 'dd_id', 'dysmorphic', 'neurological', 'metabolic', 'family_history', 'previous_test_negative'):
-            profile[key] = False
+        handler = self._sample_2_error_handlers.get(sub_label)
+        if handler is not None:
+            handler(profile)
+
+    def reset_profile_for_3b(self, profile: Dict) -> None:
+        profile.update(_3B_RESET_FLAGS)
         for key in ('prior_test_type', 'prior_test_result', 'prior_test_date'):
             profile.pop(key, None)
     
-    def _3_irrelevant_info(self, label, profile: Dict):
+    def _3_irrelevant_info(self, label, profile: Dict) -> None:
         """
         Add some irrelevant ICD codes and family history to the profile for label_type = 3.
         a) Keep the original ICD codes and add some irrelevant ones
         b) ICD codes completely irrelevant (not for genetic testing) #irrelevant clinical features
         """
         # Randomly pick 2 or 3 unique irrelevant ICD codes
-        all_irrelevant_codes = list(self.irrelevant_icd_code_mapping.keys())
-        num_irrelevant = random.randint(2, 3)
-        irrelevant_codes = random.sample(all_irrelevant_codes, num_irrelevant)
+        num_irrelevant = self._rng.randint(2, 3)
+        irrelevant_codes = self._rng.sample(self.irrelevant_icd_codes, num_irrelevant)
         if label == "3a":
             profile['secondary_icd_codes'] = irrelevant_codes
         if label == "3b":
@@ -380,26 +436,31 @@ class GroundtruthGenerator:
 
     def _generate_unique_patient_id(self, used_patient_ids: Set[str], max_attempts: int = 10000) -> str:
         for _ in range(max_attempts):
-            candidate = f"PAT-{random.randint(1000, 9999)}"
+            candidate = f"PAT-{self._rng.randint(1000, 9999)}"
             if candidate not in used_patient_ids:
                 used_patient_ids.add(candidate)
                 return candidate
         raise RuntimeError("Could not generate a unique patient_id.")
        
-    def generate_groundtruth_profile(self, patient_id: Optional[str] = None) -> Dict:
-        sex = random.choice(self.sexes)
-        first_name = random.choice(self.first_names.get(sex, self.first_names['Male']))
-        last_name = random.choice(self.last_names)  
-        patient_dob = self.generate_patient_dob()
-        patient_age = (datetime.now() - datetime.strptime(patient_dob, '%Y-%m-%d')).days // 365
-        subscriber_name = f"{random.choice(self.first_names['Male'] + self.first_names['Female'])} {last_name}"
+    def generate_groundtruth_profile(self, patient_id: Optional[str] = None,
+                                     rationale: Optional[int] = None) -> Dict:
+        choice = self._rng.choice  # bound once; used for most draws below
+        sex = choice(self.sexes)
+        first_name = choice(self.first_names.get(sex, self.first_names['Male']))
+        last_name = choice(self.last_names)  
+        # Keep the day offset so the age does not need to be re-parsed from the DOB string
+        dob_days_ago = self._patient_dob_days_ago()
+        patient_dob = self._date_days_ago(dob_days_ago)
+        patient_age = dob_days_ago // 365
+        subscriber_name = f"{choice(self._all_first_names)} {last_name}"
         subscriber_dob = self.generate_subscriber_dob(patient_age)
-        subscriber_relation = random.choice(self.subscriber_relations)
-        rationale = random.choice([1, 2])
+        subscriber_relation = choice(self.subscriber_relations)
+        if rationale is None:
+            rationale = choice([1, 2])
         test_info = self.generate_testing_info()
         
         profile = {
-            'patient_id': patient_id if patient_id else f"PAT-{random.randint(1000, 9999)}",
+            'patient_id': patient_id if patient_id else f"PAT-{self._rng.randint(1000, 9999)}",
             'patient_first_name': first_name,
             'patient_last_name': last_name,
             'patient_dob': patient_dob,
@@ -409,7 +470,7 @@ class GroundtruthGenerator:
             'subscriber_name': subscriber_name,
             'subscriber_dob': subscriber_dob,
             'subscriber_relation': subscriber_relation,
-            'provider_name': random.choice(self.provider_names),
+            'provider_name': choice(self.provider_names),
             'provider_npi': self.generate_npi(),
             'provider_phone': self.generate_phone(),
             'provider_fax': self.generate_phone(),
@@ -424,16 +485,7 @@ class GroundtruthGenerator:
             'specimen_type': test_info['specimen_type'],
             'collection_date': self.generate_recent_date(),
             'internal_test_code': test_info['internal_test_code'],
-            'mca': False,
-            'dd_id': False,
-            'dysmorphic': False,
-            'neurological': False,
-            'metabolic': False,
-            'autism': False,
-            'early_onset': False,          
-            'prior_test_negative': False,
-            'family_history': False,
-            'consanguinity': False,
+            **_CLINICAL_FLAG_DEFAULTS,
             'icd_codes': []
         }
 
@@ -449,9 +501,11 @@ class GroundtruthGenerator:
         """Generate multiple patient profiles of a given sample type."""
         profiles = []
         used_patient_ids: Set[str] = set(reserved_patient_ids or set())
-        for _ in range(count):
+        # Draw every profile's rationale (1 or 2, equally likely) in one call
+        rationales = self._rng.choices((1, 2), k=count)
+        for rationale in rationales:
             patient_id = self._generate_unique_patient_id(used_patient_ids)
-            profiles.append(self.generate_groundtruth_profile(patient_id=patient_id))
+            profiles.append(self.generate_groundtruth_profile(patient_id=patient_id, rationale=rationale))
         return profiles
     
     def generate_imperfect_profile(self, groundtruth, sample_label) -> Dict:
@@ -470,7 +524,7 @@ class GroundtruthGenerator:
         """Force repeated patient names across multiple distinct patients."""
         profile['patient_first_name'] = shared_first_name
         profile['patient_last_name'] = shared_last_name
-        profile['subscriber_name'] = f"{random.choice(self.first_names['Male'] + self.first_names['Female'])} {shared_last_name}"
+        profile['subscriber_name'] = f"{self._rng.choice(self._all_first_names)} {shared_last_name}"
 
     def _full_name(self, profile: Dict) -> str:
         return f"{profile.get('patient_first_name', '').strip()} {profile.get('patient_last_name', '').strip()}".strip()
@@ -478,8 +532,8 @@ class GroundtruthGenerator:
     def _assign_random_patient_name(self, profile: Dict) -> None:
         sex = profile.get('sex')
         sex_key = sex if isinstance(sex, str) and sex in self.first_names else 'Male'
-        first_name = random.choice(self.first_names[sex_key])
-        last_name = random.choice(self.last_names)
+        first_name = self._rng.choice(self.first_names[sex_key])
+        last_name = self._rng.choice(self.last_names)
         profile['patient_first_name'] = first_name
         profile['patient_last_name'] = last_name
 
@@ -509,15 +563,15 @@ class GroundtruthGenerator:
             raise ValueError("Pairwise collision generation requires an even number of profiles.")
 
         used_pair_names = set()
-        all_first_names = self.first_names['Male'] + self.first_names['Female']
+        all_first_names = self._all_first_names
 
         for i in range(0, len(profiles), 2):
             shared_first_name = None
             shared_last_name = None
 
             for _ in range(1000):
-                candidate_first = random.choice(all_first_names)
-                candidate_last = random.choice(self.last_names)
+                candidate_first = self._rng.choice(all_first_names)
+                candidate_last = self._rng.choice(self.last_names)
                 candidate_full = f"{candidate_first} {candidate_last}"
                 if (
                     candidate_full not in used_pair_names
@@ -584,20 +638,18 @@ class GroundtruthGenerator:
 
         existing_profiles: List[Dict[str, Any]] = []
         if output_path.exists() and output_path.stat().st_size > 0:
-            with output_path.open('r', encoding='utf-8') as f:
-                existing_content = json.load(f)
-                if isinstance(existing_content, list):
-                    existing_profiles = existing_content
-                else:
-                    raise ValueError(
-                        f"Existing file is not a JSON array and cannot be appended safely: {output_file}"
-                    )
+            existing_content = orjson.loads(output_path.read_bytes())
+            if isinstance(existing_content, list):
+                existing_profiles = existing_content
+            else:
+                raise ValueError(
+                    f"Existing file is not a JSON array and cannot be appended safely: {output_file}"
+                )
 
         combined_profiles = existing_profiles + profiles
 
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(combined_profiles, f, ensure_ascii=False, indent=2)
-            f.write('\n')
+        # orjson's indent-2 output matches json.dumps(indent=2, ensure_ascii=False) byte for byte
+        output_path.write_bytes(orjson.dumps(combined_profiles, option=orjson.OPT_INDENT_2) + b'\n')
 
         print(
             f"Saved {len(profiles)} new patient profiles to: {output_file} "
@@ -606,23 +658,22 @@ class GroundtruthGenerator:
 
     def validate_profile(self, profile: Dict[str, Any]) -> bool:
         """Validate that a generated profile meets form requirements (may fail due to intentional errors)."""
-        try:
-            from app.models import validate_submission, normalize_payload
-            normalized = normalize_payload(profile)
-            valid, errors = validate_submission(normalized)
-            if not valid:
-                print(f"Validation errors: {errors}")
-            return valid
-        except ImportError:
+        validators = _load_validators()
+        if validators is None:
             print("Warning: Could not import validation functions. Skipping validation.")
             return True
+        validate_submission, normalize_payload = validators
+        normalized = normalize_payload(profile)
+        valid, errors = validate_submission(normalized)
+        if not valid:
+            print(f"Validation errors: {errors}")
+        return valid
 
 
 def _load_json_list(path: Path) -> List[Dict[str, Any]]:
     if not path.exists() or path.stat().st_size == 0:
         return []
-    with path.open('r', encoding='utf-8') as f:
-        content = json.load(f)
+    content = orjson.loads(path.read_bytes())
     if not isinstance(content, list):
         raise ValueError(f"Expected JSON list at {path}")
     return content
@@ -673,9 +724,11 @@ if __name__ == '__main__':
                         help='Output path for generated groundtruth profiles')
     parser.add_argument('--samples-output', type=str, default=str(root_dir / 'data' / 'generated' / 'all_samples.json'),
                         help='Output path for generated labeled sample profiles')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed for reproducible output (default: unseeded)')
     args = parser.parse_args()
 
-    generator = GroundtruthGenerator()
+    generator = GroundtruthGenerator(seed=args.seed)
     groundtruth_path = Path(args.groundtruth_output)
     all_samples_path = Path(args.samples_output)
     groundtruth_path.parent.mkdir(parents=True, exist_ok=True)
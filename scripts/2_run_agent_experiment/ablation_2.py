@@ -32,6 +32,7 @@ import os
 from pathlib import Path
 from typing import List
 
+import orjson
 import pandas as pd
 from dotenv import load_dotenv
 from google import genai                    # pyright: ignore[reportAttributeAccessIssue]
@@ -93,7 +94,9 @@ def create_gemini_batch_input(base_prompt: str, profiles: List[dict], output: Pa
     to match the request keys (request-0, request-1, …) used for result lookup.
     """
     metadata = []
-    with output.open("w", encoding="utf-8") as f:
+    response_schema = ReviewResult.model_json_schema()  # identical for every request
+    # orjson emits UTF-8 bytes directly, so the file is opened in binary mode
+    with output.open("wb") as f:
         for i, p in enumerate(profiles):
             metadata.append({
                 "patient_name": f"{p.get('patient_first_name', '')} {p.get('patient_last_name', '')}".strip(),
@@ -107,10 +110,10 @@ def create_gemini_batch_input(base_prompt: str, profiles: List[dict], output: Pa
                 },
                 "config": {
                     "response_mime_type": "application/json",
-                    "response_json_schema": ReviewResult.model_json_schema(),
+                    "response_json_schema": response_schema,
                 },
             }
-            f.write(json.dumps(request) + "\n")
+            f.write(orjson.dumps(request) + b"\n")
     return metadata
 
 
@@ -187,7 +190,7 @@ _GPT_CATEGORIZATION_PROMPT = (
 def create_gpt_batch_input(gemini_responses: List[dict], output_path: Path) -> None:
     """Build an OpenAI Batch API JSONL file from Gemini responses."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
+    with output_path.open("wb") as f:
         for i, response in enumerate(gemini_responses):
             body = {
                 "model": GPT_MODEL,
@@ -210,12 +213,12 @@ def create_gpt_batch_input(gemini_responses: List[dict], output_path: Path) -> N
                 "max_output_tokens": 100,
                 "temperature": 0.5,
             }
-            f.write(json.dumps({
+            f.write(orjson.dumps({
                 "custom_id": f"patient_{i + 1}",
                 "method":    "POST",
                 "url":       "/v1/responses",
                 "body":      body,
-            }, ensure_ascii=False) + "\n")
+            }) + b"\n")
     print(f"GPT batch input written → {output_path}")
 
 
@@ -314,8 +317,8 @@ def _append_to_json(data, file_path: Path) -> None:
         except Exception:
             existing = []
     existing.extend(data)
-    with file_path.open("w", encoding="utf-8") as f:
-        json.dump(existing, f, indent=2, ensure_ascii=False)
+    # orjson writes the same indent=2 / UTF-8 layout as json.dump, much faster
+    file_path.write_bytes(orjson.dumps(existing, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
@@ -31,6 +31,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 # ── API credentials ───────────────────────────────────────────────────────────
@@ -49,6 +50,12 @@ MAX_ACTIVE_SESSIONS = int(os.getenv("BROWSER_USE_MAX_SESSIONS", "250"))
 _SESSION_SEMAPHORE = threading.Semaphore(MAX_ACTIVE_SESSIONS)
 
 # ── HTTP utilities ────────────────────────────────────────────────────────────
+# One pooled session shared by all worker threads, so API calls reuse keep-alive
+# connections instead of paying a TCP/TLS handshake per request. The pool is sized
+# to the worker cap so concurrent workers do not evict each other's connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=max(1, MAX_ACTIVE_SESSIONS)))
+
 def _api_headers() -> Dict[str, str]:
     return {
         "X-Browser-Use-API-Key": api_key,
@@ -70,7 +77,7 @@ def _request_with_retries(
 
     for attempt in range(max_retries):
         try:
-            resp = requests.request(method, url, headers=headers, json=json, timeout=timeout)
+            resp = _SESSION.request(method, url, headers=headers, json=json, timeout=timeout)
             last_resp = resp
         except requests.RequestException:
             if attempt >= max_retries - 1:
@@ -195,35 +202,35 @@ def get_submission_by_patient(
     from being picked up by future runs.
     """
     dest_dir.mkdir(parents=True, exist_ok=True)
-    resp = session.post(
+    # Context-managed so early returns release the streamed connection back to the shared pool
+    with session.post(
         f"{base_url}/download/patient",
         json={"patient_first_name": first_name, "patient_last_name": last_name},
         stream=True,
-    )
+    ) as resp:
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
 
-    if resp.status_code == 404:
-        return None
-    resp.raise_for_status()
+        filename = (
+            _filename_from_disposition(resp.headers.get("Content-Disposition"))
+            or f"submission_{uuid.uuid4().hex}.json"
+        )
 
-    filename = (
-        _filename_from_disposition(resp.headers.get("Content-Disposition"))
-        or f"submission_{uuid.uuid4().hex}.json"
-    )
+        # A JSON response without an attachment header means no file is ready
+        content_type = (resp.headers.get("Content-Type") or "").lower()
+        if "application/json" in content_type and "attachment" not in (resp.headers.get("Content-Disposition") or "").lower():
+            try:
+                if resp.json().get("file") is None:
+                    return None
+            except ValueError:
+                return None
 
-    # A JSON response without an attachment header means no file is ready
-    content_type = (resp.headers.get("Content-Type") or "").lower()
-    if "application/json" in content_type and "attachment" not in (resp.headers.get("Content-Disposition") or "").lower():
         try:
-            if resp.json().get("file") is None:
-                return None
-        except ValueError:
+            body = json.loads(resp.content.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError, json.JSONDecodeError):
             return None
 
-    try:
-        body = json.loads(resp.content.decode("utf-8"))
-    except (ValueError, UnicodeDecodeError, json.JSONDecodeError):
-        return None
-
     if body.get("payload") is None:
         return None
 
@@ -293,12 +300,11 @@ def execute_one_patient(
     # Give the server time to persist the submission before polling begins
     time.sleep(10)
 
-    http_session = requests.Session()
     first, last = _split_name(patient_name)
     saved_path = None
     for attempt in range(8):
         saved_path = get_submission_by_patient(
-            http_session, BASE_URL, first, last, llm,
+            _SESSION, BASE_URL, first, last, llm,
             patient_id, task_id, sample_type, output_dir,
         )
         if saved_path is not None:
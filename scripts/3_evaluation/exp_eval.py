@@ -19,14 +19,18 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import orjson
 import pandas as pd
 import pytz
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ── Setup ─────────────────────────────────────────────────────────────────────
 
@@ -70,13 +74,34 @@ def _api_headers() -> Dict[str, str]:
     return {"X-Browser-Use-API-Key": key}
 
 
+# Shared session so paginated requests reuse the same TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=1.0,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET",),
+                      # Hand the last response back so raise_for_status() still raises HTTPError
+                      raise_on_status=False),
+))
+
+
 def get_task(task_id: str) -> Dict:
-    resp = requests.get(f"{API_BASE}/{task_id}", headers=_api_headers(), timeout=60)
+    resp = _SESSION.get(f"{API_BASE}/{task_id}", headers=_api_headers(), timeout=60)
     resp.raise_for_status()
     return resp.json()
 
 
-def get_tasks(start_et: str, end_et: str, output_path: Optional[Path] = None) -> List[Dict]:
+def _get_tasks_page(params: Dict, page: int) -> List[Dict]:
+    resp = _SESSION.get(API_BASE, headers=_api_headers(),
+                        params={**params, "pageNumber": page}, timeout=60)
+    resp.raise_for_status()
+    return resp.json().get("items", [])
+
+
+def get_tasks(start_et: str, end_et: str, output_path: Optional[Path] = None,
+              workers: int = 4) -> List[Dict]:
     """Fetch all tasks within an Eastern Time window from the Browser-Use Cloud API.
 
     Results are merged (by task ID) with any existing tasks already saved to
@@ -85,6 +110,7 @@ def get_tasks(start_et: str, end_et: str, output_path: Optional[Path] = None) ->
     Args:
         start_et: Start time in ET, e.g. "2026-01-01T08:00:00"
         end_et:   End time in ET, e.g.   "2026-01-01T12:00:00"
+        workers:  Number of pages requested concurrently per round after a full first page
     """
     et_zone = pytz.timezone("US/Eastern")
     utc_zone = pytz.utc
@@ -95,15 +121,11 @@ def get_tasks(start_et: str, end_et: str, output_path: Optional[Path] = None) ->
     before_utc = end_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     tasks_out = []
-    page, page_size = 1, 100
-    while True:
-        resp = requests.get(API_BASE, headers=_api_headers(),
-                            params={"after": after_utc, "before": before_utc,
-                                    "pageSize": page_size, "pageNumber": page})
-        resp.raise_for_status()
-        items = resp.json().get("items", [])
-        if not items:
-            break
+    page_size = 100
+    params = {"after": after_utc, "before": before_utc, "pageSize": page_size}
+    workers = max(1, workers)
+
+    def _collect(items: List[Dict]) -> None:
         for task in items:
             tasks_out.append({
                 "id":          task.get("id"),
@@ -116,9 +138,23 @@ def get_tasks(start_et: str, end_et: str, output_path: Optional[Path] = None) ->
                 "cost":        task.get("cost"),
                 "metadata":    task.get("metadata", {}),
             })
-        if len(items) < page_size:
-            break
-        page += 1
+
+    # Most windows fit in one page, so page 1 is fetched alone. Only when it comes
+    # back full are later pages fetched in rounds of `workers`, stopping at the
+    # first short (or empty) page since the total page count is not known.
+    first = _get_tasks_page(params, 1)
+    _collect(first)
+    if len(first) == page_size:
+        page, done = 2, False
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while not done:
+                pages = pool.map(lambda p: _get_tasks_page(params, p), range(page, page + workers))
+                for items in pages:
+                    _collect(items)
+                    if len(items) < page_size:
+                        done = True
+                        break
+                page += workers
 
     # Merge fetched tasks with the cached file (newer fetch wins on conflict)
     try:
@@ -133,8 +169,7 @@ def get_tasks(start_et: str, end_et: str, output_path: Optional[Path] = None) ->
                 existing = loaded
         merged = {str(t.get("id", "")).strip(): t for t in existing}
         merged.update({str(t.get("id", "")).strip(): t for t in tasks_out if t.get("id")})
-        with cache_path.open("w", encoding="utf-8") as f:
-            json.dump(list(merged.values()), f, ensure_ascii=False, indent=2)
+        cache_path.write_bytes(orjson.dumps(list(merged.values()), option=_JSON_DUMP_OPTS))
     except Exception as e:
         logger.warning("Failed to write tasks cache: %s", e)
 
@@ -173,13 +208,34 @@ def _index_by_patient_id(records: List[Dict]) -> Dict[str, Dict]:
     return {str(r["patient_id"]): r for r in records if r.get("patient_id") is not None}
 
 
-def check_submitted(submission: Dict, groundtruth: Dict) -> Dict:
+def _norm_str(value) -> str:
+    return str(value).strip().lower()
+
+
+def _precompute_norm(groundtruth: Dict) -> Dict:
+    """Normalize the string and list ground-truth values once so they can be
+    reused across every submission for the same patient."""
+    norm: Dict = {}
+    for key, value in groundtruth.items():
+        if isinstance(value, str):
+            norm[key] = _norm_str(value)
+        elif isinstance(value, list):
+            norm[key] = [_norm_str(x) for x in value]
+    return norm
+
+
+def check_submitted(submission: Dict, groundtruth: Dict,
+                    groundtruth_norm: Optional[Dict] = None) -> Dict:
     """Compare a submitted form payload against the ground truth record.
 
+    groundtruth_norm is the output of _precompute_norm(groundtruth); pass it
+    when the same ground truth is compared against many submissions.
+
     Returns a summary dict with per-field correctness (1 = correct,
     dict with Expected/Got = incorrect) plus aggregate counts.
     """
     payload = submission.get("payload", {})
+    gt_norm = groundtruth_norm if groundtruth_norm is not None else _precompute_norm(groundtruth)
 
     # ── Field normalizers ──────────────────────────────────────────────────────
     def _digits_only(value) -> str:
@@ -190,9 +246,6 @@ def check_submitted(submission: Dict, groundtruth: Dict) -> Dict:
         s = value[0] if isinstance(value, list) and value else value
         return "".join(ch for ch in str(s) if ch.isalnum())
 
-    def _norm_str(value) -> str:
-        return str(value).strip().lower()
-
     def _to_list(value) -> List:
         if value is None:
             return []
@@ -223,25 +276,29 @@ def check_submitted(submission: Dict, groundtruth: Dict) -> Dict:
         return a == b, _cpt_counter(a) == _cpt_counter(b)
 
     def _equal(key: str, a, b) -> bool:
-        """Flexible, type-aware equality for form fields."""
+        """Flexible, type-aware equality for form fields.
+
+        b is always groundtruth[key], so its normalized form comes from gt_norm.
+        """
         if key in {"member_id", "provider_phone", "provider_fax"}:
             return _digits_only(a) == _digits_only(b)
         if key in {"patient_address", "provider_address", "lab_address"}:
             return _alphanumeric_only(a) == _alphanumeric_only(b)
         if key == "icd_codes":
-            return {_norm_str(x) for x in a} == {_norm_str(x) for x in b}
+            b_norm = gt_norm[key] if isinstance(b, list) else [_norm_str(x) for x in b]
+            return {_norm_str(x) for x in a} == set(b_norm)
         if key == "cpt_codes":
             _, semantic = _cpt_correctness(a, b)
             return semantic
         # Handle single-item list vs scalar
         if isinstance(a, list) and not isinstance(b, list) and len(a) == 1:
-            return _norm_str(a[0]) == _norm_str(b)
+            return _norm_str(a[0]) == (gt_norm[key] if isinstance(b, str) else _norm_str(b))
         if isinstance(b, list) and not isinstance(a, list) and len(b) == 1:
-            return _norm_str(b[0]) == _norm_str(a)
+            return gt_norm[key][0] == _norm_str(a)
         if isinstance(a, str) and isinstance(b, str):
-            return _norm_str(a) == _norm_str(b)
+            return _norm_str(a) == gt_norm[key]
         if isinstance(a, list) and isinstance(b, list):
-            return len(a) == len(b) and [_norm_str(x) for x in a] == [_norm_str(x) for x in b]
+            return len(a) == len(b) and [_norm_str(x) for x in a] == gt_norm[key]
         return a == b
 
     # ── Build per-field summary ────────────────────────────────────────────────
@@ -291,7 +348,11 @@ def get_submitted_summaries(groundtruth_path: Path, submissions_dir: Path,
         groundtruths = _index_by_patient_id(json.load(f))
 
     summaries = []
-    for submission_file in submissions_dir.glob("*.json"):
+    groundtruth_norms: Dict[str, Dict] = {}  # normalized ground truth, built once per patient
+    with os.scandir(submissions_dir) as it:
+        submission_files = [Path(e.path) for e in it
+                            if e.name.endswith(".json") and e.is_file()]
+    for submission_file in submission_files:
         with submission_file.open("r", encoding="utf-8") as f:
             submission = json.load(f)
         patient_id = submission.get("patient_id")
@@ -302,7 +363,9 @@ def get_submitted_summaries(groundtruth_path: Path, submissions_dir: Path,
         if not groundtruth:
             logger.warning("No ground truth for patient_id %s — skipped", patient_id)
             continue
-        summaries.append(check_submitted(submission, groundtruth))
+        if patient_id not in groundtruth_norms:
+            groundtruth_norms[patient_id] = _precompute_norm(groundtruth)
+        summaries.append(check_submitted(submission, groundtruth, groundtruth_norms[patient_id]))
 
     if output_path:
         _upsert_json(output_path, summaries, key="task_id")
@@ -350,14 +413,16 @@ def check_non_submitted(task_list: List[Dict], submitted_summaries: List[Dict])
     for task in task_list:
         if task.get("isSuccess") is not False:
             continue
-        if str(task.get("id", "")).strip() in submitted_task_ids:
+        task_id = task.get("id", "")
+        if str(task_id).strip() in submitted_task_ids:
             continue
-        sample_type = task.get("metadata", {}).get("sample_type", "")
+        metadata = task.get("metadata", {})
+        sample_type = metadata.get("sample_type", "")
         summaries.append({
-            "task_id":       task.get("id", ""),
+            "task_id":       task_id,
             "llm":           task.get("llm", ""),
             "sample_type":   sample_type,
-            "patient_name":  task.get("metadata", {}).get("patient_name", ""),
+            "patient_name":  metadata.get("patient_name", ""),
             "submitted":     False,
             "confusion_label": "TN" if sample_type in {"2a", "2b", "2c", "3b"} else "FN",
             "num_incorrect": None,
@@ -371,26 +436,28 @@ def check_non_submitted(task_list: List[Dict], submitted_summaries: List[Dict])
 
 def create_batch_input(summaries: List[Dict], output_path: Path) -> None:
     """Write a GPT Batch API JSONL file to classify non-submitted task reasons."""
-    with output_path.open("w", encoding="utf-8") as f:
-        for i, summary in enumerate(summaries):
-            # Truncate long output messages to stay within token limits
-            output_msg = str(summary.get("output_msg") or "")
-            if len(output_msg) > 6000:
-                output_msg = output_msg[:6000] + "\n...[truncated]"
-            content = _NON_SUBMITTED_CLASSIFICATION_PROMPT + json.dumps(
-                {"sample_type": summary.get("sample_type", ""), "output_msg": output_msg}, indent=2
-            )
-            f.write(json.dumps({
-                "custom_id": f"summary_{i + 1}",
-                "method":    "POST",
-                "url":       "/v1/responses",
-                "body": {
-                    "model": "gpt-5.2",
-                    "input": [{"role": "user", "content": content}],
-                    "max_output_tokens": 20,
-                    "temperature": 0,
-                },
-            }, ensure_ascii=False) + "\n")
+    lines: List[bytes] = []
+    for i, summary in enumerate(summaries):
+        # Truncate long output messages to stay within token limits
+        output_msg = str(summary.get("output_msg") or "")
+        if len(output_msg) > 6000:
+            output_msg = output_msg[:6000] + "\n...[truncated]"
+        content = _NON_SUBMITTED_CLASSIFICATION_PROMPT + json.dumps(
+            {"sample_type": summary.get("sample_type", ""), "output_msg": output_msg}, indent=2
+        )
+        lines.append(orjson.dumps({
+            "custom_id": f"summary_{i + 1}",
+            "method":    "POST",
+            "url":       "/v1/responses",
+            "body": {
+                "model": "gpt-5.2",
+                "input": [{"role": "user", "content": content}],
+                "max_output_tokens": 20,
+                "temperature": 0,
+            },
+        }) + b"\n")
+    # One write for the whole file instead of one per request line
+    output_path.write_bytes(b"".join(lines))
     logger.info("Batch input written: %s", output_path)
 
 
@@ -470,18 +537,18 @@ def raw_summary(submitted_json_path: Path, non_submitted_json_path: Path,
 
 def compute_metrics(summary: pd.DataFrame) -> pd.DataFrame:
     """Compute per-LLM sensitivity and specificity from confusion labels."""
-    def _sensitivity(tp, fn): return tp / (tp + fn) if (tp + fn) > 0 else None
-    def _specificity(tn, fp): return tn / (tn + fp) if (tn + fp) > 0 else None
-
-    rows = []
-    for llm, group in summary.groupby("llm", dropna=False):
-        tp = int((group["confusion_label"] == "TP").sum())
-        tn = int((group["confusion_label"] == "TN").sum())
-        fp = int((group["confusion_label"] == "FP").sum())
-        fn = int((group["confusion_label"] == "FN").sum())
-        rows.append({"llm": llm, "TP": tp, "TN": tn, "FP": fp, "FN": fn,
-                     "sensitivity": _sensitivity(tp, fn), "specificity": _specificity(tn, fp)})
-    return pd.DataFrame(rows).sort_values("llm", kind="stable", ignore_index=True)
+    # One grouped count gives a column per confusion label (llm × TP/TN/FP/FN)
+    counts = (summary.groupby(["llm", "confusion_label"], dropna=False).size()
+              .unstack(fill_value=0)
+              .reindex(columns=["TP", "TN", "FP", "FN"], fill_value=0)
+              .astype(int))
+    tp, tn, fp, fn = counts["TP"], counts["TN"], counts["FP"], counts["FN"]
+    metrics = counts.assign(
+        sensitivity=(tp / (tp + fn)).where(tp + fn > 0),
+        specificity=(tn / (tn + fp)).where(tn + fp > 0),
+    )
+    metrics.columns.name = None
+    return metrics.reset_index().sort_values("llm", kind="stable", ignore_index=True)
 
 
 def accuracy_table(raw_summary_df: pd.DataFrame, start_col: str, end_col: str) -> pd.DataFrame:
@@ -539,7 +606,7 @@ def non_submitted_table(non_submitted_json_path: Path) -> pd.DataFrame:
     if "classification_result" in df.columns:
         df["classification_result"] = (
             df["classification_result"].fillna("").astype(str)
-            .apply(lambda v: re.sub(r"[^A-Za-z\s]+", "", v))
+            .str.replace(r"[^A-Za-z\s]+", "", regex=True)
             .str.replace(r"\s+", " ", regex=True).str.strip()
         )
     sort_cols = [c for c in ["llm", "sample_type"] if c in df.columns]
@@ -549,6 +616,9 @@ def non_submitted_table(non_submitted_json_path: Path) -> pd.DataFrame:
 
 # ── Shared file helper ────────────────────────────────────────────────────────
 
+# Same layout as json.dump(..., indent=2, ensure_ascii=False), serialized by orjson
+_JSON_DUMP_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 def _upsert_json(path: Path, new_records: List[Dict], key: str) -> None:
     """Append records to a JSON array file, skipping any whose key already exists."""
     if not new_records:
@@ -577,8 +647,7 @@ def _upsert_json(path: Path, new_records: List[Dict], key: str) -> None:
             no_key.append(r)
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(list(by_key.values()) + no_key, f, ensure_ascii=False, indent=2)
+    path.write_bytes(orjson.dumps(list(by_key.values()) + no_key, option=_JSON_DUMP_OPTS))
     logger.info("Saved %d records to %s", len(new_records), path)
 
 